@@ -11,13 +11,12 @@ def subnodes_by_inputs(graph, inputs: list) -> list:
     """
 
     subgraph_nodes = []
+    inputs = frozenset(inputs)
 
     for node, sig in nx.get_node_attributes(graph, "signature").items():
-        sig_params = sig.parameters
-        for param in inputs:
-            if param in sig_params:
-                subgraph_nodes.append(node)
-                subgraph_nodes.extend(nx.descendants(graph, node))
+        if not inputs.isdisjoint(sig.parameters):
+            subgraph_nodes.append(node)
+            subgraph_nodes.extend(nx.descendants(graph, node))
 
     return subgraph_nodes
 
@@ -34,6 +33,8 @@ def subnodes_by_outputs(graph, outputs: list) -> list:
     """
 
     subgraph_nodes = []
+    outputs = frozenset(outputs)
+
     for node, output in nx.get_node_attributes(graph, "output").items():
         if output in outputs:
             subgraph_nodes.append(node)
@@ -82,15 +82,18 @@ class Graph(nx.DiGraph):
     def update_graph(self):
         """Update edge attributes based on node objects and edges."""
 
-        for u, v in self.edges:
-            if self.nodes[u] and self.nodes[v]:
-                # the edge "output" is not defined if the parent node does not
-                # have "output" attribute or the child node does not have
-                # the parameter
-                # extract the parameter dictionary
-                v_sig = self.nodes[v]["signature"].parameters
-                if self.nodes[u]["output"] in v_sig:
-                    self.edges[u, v]["output"] = self.nodes[u]["output"]
+        for u, children in self._succ.items():
+            u_attr = self._node[u]
+            for v, edge_attr in children.items():
+                v_attr = self._node[v]
+                if u_attr and v_attr:
+                    # the edge "output" is not defined if the parent node does
+                    # not have "output" attribute or the child node does not
+                    # have the parameter
+                    # extract the parameter dictionary
+                    v_sig = v_attr["signature"].parameters
+                    if u_attr["output"] in v_sig:
+                        edge_attr["output"] = u_attr["output"]
 
     # graph operations
     def subgraph(self, nodes=None, inputs=None, outputs=None):
@@ -144,7 +147,7 @@ class Graph(nx.DiGraph):
         Draws the default styled graph.
 
         :param str outfile: filename to save the graph as. The file extension
-            is needed.
+            is needed. The ".dot" and ".gv" files contain the DOT source.
         """
 
         return plain_visualizer(self, str(self), outfile)
@@ -32,6 +32,12 @@ class TopologicalHandler:
         self.__signature__ = modelgraph_signature(graph)
         self.returns = returns
         self.order = graph_topological_sort(graph)
+        # parameter names of each node, the node signatures are not
+        # inspected during the execution
+        self.node_parameters = {
+            node: tuple(node_attr["signature"].parameters)
+            for node, node_attr in self.order
+        }
         self.graph = graph
         self.datacls_kwargs = datacls_kwargs
 
@@ -82,7 +88,7 @@ class TopologicalHandler:
     def run_node(self, data, node, node_attr):
         """Run the individual node."""
 
-        kwargs = {key: data[key] for key in node_attr["signature"].parameters}
+        kwargs = {key: data[key] for key in self.node_parameters[node]}
         node_object = node_attr["node_object"]
 
         try:
@@ -49,12 +49,30 @@ class MetaDataFormatter:
 
             metadata_list.extend(entry)
 
+        # short single lines without tabs or surrounding whitespace are
+        # returned unchanged by a standard text wrapper that does not
+        # indent or rewrite the text, and are not wrapped
+        text_wrapper = self.text_wrapper
+        skip_short = (
+            type(text_wrapper) is TextWrapper
+            and not text_wrapper.initial_indent
+            and not text_wrapper.fix_sentence_endings
+            and text_wrapper.max_lines is None
+        )
+
         metadata_wrapped = []
         for line in metadata_list:
-            if line:
-                metadata_wrapped.extend(self.text_wrapper.wrap(line))
-            else:
+            if not line:
                 metadata_wrapped.append("")
+            elif (
+                skip_short
+                and len(line) <= text_wrapper.width
+                and line.isprintable()
+                and line == line.strip()
+            ):
+                metadata_wrapped.append(line)
+            else:
+                metadata_wrapped.extend(text_wrapper.wrap(line))
 
         return "\n".join(metadata_wrapped).strip()
 
@@ -108,7 +126,10 @@ def modifier_metadata(closure):
 
     if hasattr(closure, "metadata"):
         return closure.metadata
-    elif not inspect.getclosurevars(closure).nonlocals:
+
+    # the closure variables are inspected once for both cases
+    kwargs = inspect.getclosurevars(closure).nonlocals
+    if not kwargs:
         return closure.__name__
 
     else:  # closure takes arguments
@@ -118,7 +139,6 @@ def modifier_metadata(closure):
         # parent function name.
 
         name = closure.__qualname__.rsplit(".<locals>.")[-2]
-        kwargs = inspect.getclosurevars(closure).nonlocals
         kwargs_str = ", ".join(f"{k}={repr(v)}" for k, v in kwargs.items())
         return f"{name}({kwargs_str})"
 
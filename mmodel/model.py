@@ -8,7 +8,7 @@ from mmodel.utility import (
 
 import networkx as nx
 from mmodel.metadata import modelformatter
-from mmodel.signature import restructure_signature
+from mmodel.signature import restructure_signature, binding_info, bind_arguments
 from inspect import signature
 from mmodel.visualizer import visualizer
 
@@ -66,6 +66,9 @@ class Model:
         self.model_func.__signature__ = restructure_signature(
             signature(self.model_func), self._defaults
         )
+        # binding information with the signature it belongs to
+        sig = self.model_func.__signature__
+        self._binding = sig, binding_info(sig)
 
     @property
     def order(self):
@@ -114,10 +117,13 @@ class Model:
         The inputs from the keyword arguments are parsed and passed to the
         the handler class.
         """
-        bound = self.signature.bind(*args, **kwargs)
         # defaults are added in the signature property
-        bound.apply_defaults()
-        return self.model_func(**bound.arguments)
+        sig = self.signature
+        binding = self._binding
+        if binding[0] is not sig:
+            binding = self._binding = sig, binding_info(sig)
+        arguments = bind_arguments(sig, binding[1], args, kwargs)
+        return self.model_func(**arguments)
 
     def __str__(self):
         return modelformatter(self)
@@ -163,7 +169,7 @@ class Model:
             Plain shows nodes only, short shows part of the metadata, and
             long shows all the metadata.
         :param str export: filename to save the graph as. The file extension
-            is needed.
+            is needed. The ".dot" and ".gv" files contain the DOT source.
         """
 
         return visualizer(self._graph, str(self), outfile)
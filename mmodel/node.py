@@ -4,8 +4,10 @@ from mmodel.signature import (
     convert_signature,
     has_signature,
     check_signature,
+    binding_info,
+    bind_arguments,
+    func_signature,
 )
-from inspect import signature
 from mmodel.metadata import nodeformatter
 from mmodel.utility import construction_dict, modify_func, parse_functype
 from mmodel.model import Model
@@ -29,6 +31,8 @@ class Node:
         self._base_func = self.convert_func(func, self._inputs)
         # allow overwrite
         self.node_func = modify_func(self._base_func, self._modifiers)
+        # binding information with the signature it belongs to
+        self._binding = None, None
 
         # kwargs can overwrite values like doc, functype, etc.
         for key, value in kwargs.items():
@@ -37,7 +41,8 @@ class Node:
     @property
     def __signature__(self):
         """Node signature for inspection."""
-        return signature(self.node_func)
+
+        return func_signature(self.node_func)
 
     @property
     def signature(self):
@@ -49,17 +54,21 @@ class Node:
 
         For ``numpy.ufunc`` and builtin type, the "inputs" argument is required.
 
-        If inputs are provided, the signature is
-        changed based on the inputs and keyword-only.
-        If the "inputs" is None, the signature is changed keyword only,
-        and the default values are removed.
+        If inputs are provided, the signature is changed based on the inputs.
+        If the "inputs" is None, the parameters are converted to
+        positional-or-keyword, and the parameters with default values
+        are removed. Functions whose signatures already fit are used directly.
 
-        The keyword-only design reduced binding overhead during the function
-        calls, and allow more consistency between node, modifier, and model.
+        The changed signatures are generated wrappers with
+        positional-or-keyword parameters, which pass the arguments straight
+        to the original function without binding them for every call.
         """
 
         if isinstance(func, Model):
             func = func.model_func
+        elif not callable(func):
+            # fail before the signature inspection formats the object
+            raise TypeError(f"{type(func).__name__} object is not callable")
 
         if not has_signature(func):
             if not inputs:
@@ -101,9 +110,12 @@ class Node:
         is used for external calls.
         """
 
-        bound = self.signature.bind(*args, **kwargs)
-        bound.apply_defaults()  # There's no defaults allowed, added regardless
-        return self.node_func(**bound.arguments)
+        sig = self.signature
+        binding = self._binding
+        if binding[0] is not sig:
+            binding = self._binding = sig, binding_info(sig)
+        arguments = bind_arguments(sig, binding[1], args, kwargs)
+        return self.node_func(**arguments)
 
     def __str__(self):
         return nodeformatter(self)
@@ -1,7 +1,18 @@
-from inspect import signature, Parameter, Signature
-from functools import wraps
+from inspect import signature, Parameter, Signature, CO_VARARGS, CO_VARKEYWORDS
+from functools import wraps, lru_cache
+from types import BuiltinFunctionType, FunctionType, ModuleType
+from weakref import WeakKeyDictionary
 from mmodel.utility import param_sorter
-from collections import defaultdict
+
+# parameter kinds bound to module-level names for the classification loops
+_POS_ONLY = Parameter.POSITIONAL_ONLY
+_POS_OR_KW = Parameter.POSITIONAL_OR_KEYWORD
+_VAR_POS = Parameter.VAR_POSITIONAL
+_KW_ONLY = Parameter.KEYWORD_ONLY
+_VAR_KW = Parameter.VAR_KEYWORD
+
+# parameter kinds allowed in the node function signature
+NODE_PARAMETER_KINDS = frozenset([_POS_OR_KW, _KW_ONLY])
 
 
 def split_arguments(sig, arguments):
@@ -16,40 +27,122 @@ def split_arguments(sig, arguments):
 
     args = []
     for param in sig.parameters.values():
-        if param.kind == 0:
+        if param.kind == _POS_ONLY:
             args.append(arguments.pop(param.name))
 
     return args, arguments
 
 
+def signature_source(sig):
+    """Convert the signature to the parameter string of a function definition.
+
+    The parameter names are used directly, defaults and annotations
+    are not included. The keyword-only parameters are separated by "*".
+
+    :param inspect.Signature sig: signature without VAR_POSITIONAL
+        or VAR_KEYWORD parameters
+    """
+
+    param_str_list = []
+    kw_only = False
+    for param in sig.parameters.values():
+        if param.kind == _KW_ONLY and not kw_only:
+            param_str_list.append("*")
+            kw_only = True
+        param_str_list.append(param.name)
+
+    return ", ".join(param_str_list)
+
+
+@lru_cache(maxsize=1024)
+def compile_source(source):
+    """Compile the wrapper source code.
+
+    The wrappers with the same parameters and call arguments share
+    the same code object; only the wrapped function differs.
+    """
+
+    return compile(source, "<string>", "exec")
+
+
+def compile_wrapper(func, sig, call_args):
+    """Generate the wrapper function of the signature.
+
+    The wrapper is generated from the source code that maps the parameters
+    of the new signature to the arguments of the original function. The
+    argument parsing is handled by the interpreter, without binding the
+    signature for every function call.
+
+    :param callable func: function to wrap
+    :param inspect.Signature sig: signature of the wrapper
+    :param list call_args: argument strings of the original function call,
+        for example, ["a", "b", "c=c"]
+    """
+
+    # avoid the function name colliding with the parameters
+    func_name = "func"
+    while func_name in sig.parameters:
+        func_name = f"_{func_name}"
+
+    source = (
+        f"def wrapped({signature_source(sig)}):\n"
+        f"    return {func_name}({', '.join(call_args)})\n"
+    )
+
+    namespace = {}
+    exec(compile_source(source), {func_name: func}, namespace)
+    wrapped = wraps(func)(namespace["wrapped"])
+    wrapped.__signature__ = sig
+    return wrapped
+
+
+def classify_parameters(sig):
+    """Group the signature parameters by kind in a single pass.
+
+    :param inspect.Signature sig: signature to classify
+    :returns: parameter names by kind, parameter count by kind, and
+        non-default parameter count by kind. The counts are lists indexed
+        by the parameter kind.
+    :rtype: (dict, list, list)
+    """
+
+    sig_dict = {kind: [] for kind in range(5)}
+    sig_count = [0] * 5
+    nd_sig_count = [0] * 5
+
+    for param in sig.parameters.values():
+        kind = param.kind
+        sig_dict[kind].append(param.name)
+        sig_count[kind] += 1
+        if param.default is Parameter.empty:
+            nd_sig_count[kind] += 1
+
+    return sig_dict, sig_count, nd_sig_count
+
+
 def modify_signature(func, inputs):
     """Modify function signature to custom-defined inputs.
 
     The inputs replace the original signature in the same
-    order. The resulting function is a keyword-only function.
-    The conversion ignores VAR_POSITIONAL (args). For these
-    functions, create a new function instead.
+    order. The resulting function is a generated wrapper with
+    positional-or-keyword parameters, which maps the arguments to the
+    original function parameters. For functions with VAR_POSITIONAL (args)
+    and no keyword parameters, the inputs are passed positionally.
+    If the inputs are the same as the function parameters, and all
+    parameters are positional-or-keyword without defaults, the function
+    is returned without a wrapper.
 
     :param callable func: function to change signature
     :param list inputs: new input parameters for the function.
     """
 
-    sig = signature(func)
+    sig = func_signature(func)
+    sig_dict, sig_count, nd_sig_count = classify_parameters(sig)
 
-    # check if input parameters are less than the parameters required
-    # excludes parameters with defaults
-    sig_dict = defaultdict(list)
-    sig_default_dict = defaultdict(list)
-
-    for param in sig.parameters.values():
-        sig_dict[param.kind].append(param.name)
-        if param.default is not Parameter.empty:
-            sig_default_dict[param.kind].append(param.name)
-
-    sig_count = [len(sig_dict[key]) for key in [0, 1, 2, 3, 4]]
-    nd_sig_count = [
-        len(sig_dict[key]) - len(sig_default_dict[key]) for key in [0, 1, 2, 3, 4]
-    ]
+    # the signature is unchanged, no wrapper needed
+    all_pos_or_kw = nd_sig_count[_POS_OR_KW] == len(sig.parameters)
+    if all_pos_or_kw and list(inputs) == sig_dict[_POS_OR_KW]:
+        return func
 
     # there are four cases for max_length
     # case 1: var_kw - max = unlimited
@@ -57,27 +150,29 @@ def modify_signature(func, inputs):
     # case 3: var_pos, no var_kw, no kw_only - max = unlimited
     # case 4: no var_pos, no kw_only, no var_kw - max = pos + pos_or_kw
     pos_expand = False
-    if sig_count[4] > 0:
+    if sig_count[_VAR_KW] > 0:
         max_length = None
-    elif sig_count[3] > 0:
-        max_length = sig_count[0] + sig_count[1] + sig_count[3]
-    elif sig_count[2] > 0:
+    elif sig_count[_KW_ONLY] > 0:
+        max_length = sig_count[_POS_ONLY] + sig_count[_POS_OR_KW] + sig_count[_KW_ONLY]
+    elif sig_count[_VAR_POS] > 0:
         max_length = None
         pos_expand = True
     else:
-        max_length = sig_count[0] + sig_count[1]
+        max_length = sig_count[_POS_ONLY] + sig_count[_POS_OR_KW]
 
     # there are three cases for min_length (nd = non-default)
     # case 1: nd kw_only - min = nd kw + pos_or_kw + pos
     # case 2: nd pos_or_kw, no nd kw_only - min = nd pos_or_kw + pos
     # case 3: no nd pos_or_kw, no nd kw_only - min = nd pos
 
-    if nd_sig_count[3] > 0:
-        min_length = nd_sig_count[3] + sig_count[1] + sig_count[0]
-    elif nd_sig_count[1] > 0:
-        min_length = nd_sig_count[1] + sig_count[0]
+    if nd_sig_count[_KW_ONLY] > 0:
+        min_length = (
+            nd_sig_count[_KW_ONLY] + sig_count[_POS_OR_KW] + sig_count[_POS_ONLY]
+        )
+    elif nd_sig_count[_POS_OR_KW] > 0:
+        min_length = nd_sig_count[_POS_OR_KW] + sig_count[_POS_ONLY]
     else:
-        min_length = nd_sig_count[0]
+        min_length = nd_sig_count[_POS_ONLY]
 
     # check if the inputs are enough for the function
     if min_length > len(inputs):
@@ -87,35 +182,31 @@ def modify_signature(func, inputs):
 
     new_param = []
     for element in inputs:
-        new_param.append(Parameter(element, kind=Parameter.POSITIONAL_OR_KEYWORD))
+        new_param.append(Parameter(element, kind=_POS_OR_KW))
     new_sig = Signature(new_param)
 
-    # remove the *args and **kwargs
-    param_list = sig_dict[0] + sig_dict[1] + sig_dict[3]
-    param_pair = list(zip(param_list, inputs))
+    # all parameters are positional
+    if pos_expand:
+        return compile_wrapper(func, new_sig, inputs)
 
-    @wraps(func)
-    def wrapped(**kwargs):
-        # all parameters are positional
-        if pos_expand:
-            return func(*kwargs.values())
-
-        # if keyword argument exists in the original signature
-        adjusted_args = []
-        adjusted_kwargs = {}
-
-        for old_key, new_key in param_pair:
-            if old_key in sig_dict[0]:
-                adjusted_args.append(kwargs.pop(new_key))
-            else:
-                adjusted_kwargs[old_key] = kwargs.pop(new_key)
+    # remove the *args and **kwargs
+    param_list = sig_dict[_POS_ONLY] + sig_dict[_POS_OR_KW] + sig_dict[_KW_ONLY]
 
-        adjusted_kwargs.update(kwargs)
+    # the positional-only parameters lead the parameter list, the index
+    # replaces the membership check of the positional-only names
+    pos_only_count = sig_count[_POS_ONLY]
+    param_count = len(param_list)
 
-        return func(*adjusted_args, **adjusted_kwargs)
+    call_args = []
+    for i, new_key in enumerate(inputs):
+        if i >= param_count:  # additional keyword arguments
+            call_args.append(f"{new_key}={new_key}")
+        elif i < pos_only_count:
+            call_args.append(new_key)
+        else:
+            call_args.append(f"{param_list[i]}={new_key}")
 
-    wrapped.__signature__ = new_sig
-    return wrapped
+    return compile_wrapper(func, new_sig, call_args)
 
 
 def add_signature(func, inputs):
@@ -131,16 +222,11 @@ def add_signature(func, inputs):
 
     new_param = []
     for element in inputs:
-        new_param.append(Parameter(element, kind=Parameter.POSITIONAL_OR_KEYWORD))
+        new_param.append(Parameter(element, kind=_POS_OR_KW))
 
     new_sig = Signature(new_param)
 
-    @wraps(func)
-    def wrapped(**kwargs):
-        return func(*kwargs.values())
-
-    wrapped.__signature__ = new_sig
-    return wrapped
+    return compile_wrapper(func, new_sig, inputs)
 
 
 def convert_signature(func):
@@ -151,40 +237,40 @@ def convert_signature(func):
     Use inputs to include the parameters.
     """
 
-    sig = signature(func)
-    parameters = dict(sig.parameters)
+    sig = func_signature(func)
 
+    # single pass over the parameters, the parameter is only replaced
+    # if the kind changes
     param_list = []
-    for param in parameters.values():
-        if (param.kind == 1 or param.kind == 3) and param.default is Parameter.empty:
+    call_args = []
+    for param in sig.parameters.values():
+        if param.kind == _POS_ONLY:  # defaults cannot be added to pos only parameter
+            param_list.append(param.replace(kind=_POS_OR_KW, default=Parameter.empty))
+            call_args.append(param.name)
+        elif param.kind in NODE_PARAMETER_KINDS and param.default is Parameter.empty:
             param_list.append(param)
-        elif param.kind == 0:  # defaults cannot be added to pos only parameter
-            param_list.append(
-                Parameter(param.name, kind=Parameter.POSITIONAL_OR_KEYWORD)
-            )
+            call_args.append(f"{param.name}={param.name}")
 
-    new_sig = Signature(parameters=param_list)
+    # no parameter is removed or converted
+    if param_list == list(sig.parameters.values()):
+        return func
 
-    @wraps(func)
-    def wrapped(**kwargs):
-        # arguments = new_sig.bind(*args, **kwargs).arguments
-        args, kwargs = split_arguments(sig, kwargs)
-        return func(*args, **kwargs)
+    # the original parameter order is kept and the defaults are removed,
+    # the validation of the parameter order is skipped
+    new_sig = Signature(param_list, __validate_parameters__=False)
 
-    wrapped.__signature__ = new_sig
-    return wrapped
+    return compile_wrapper(func, new_sig, call_args)
 
 
-def restructure_signature(
-    signature, default_dict, kind=Parameter.POSITIONAL_OR_KEYWORD
-):
+def restructure_signature(signature, default_dict, kind=_POS_OR_KW):
     """Add defaults to signature for Model.
 
     Here the parameter kinds are replaced with kind (defaults
     to POSITIONAL_OR_KEYWORD), and defaults are applied.
     The final signatures are sorted. The function is used in
     the Model signature definition, therefore no VAR_POSITIONAL
-    or VAR_KEYWORD should be in the signature.
+    or VAR_KEYWORD should be in the signature. If no parameter
+    changes, the original signature is returned.
 
 
     :param inspect.Signature signature: signature to add defaults
@@ -193,16 +279,198 @@ def restructure_signature(
     """
 
     param_list = []
+    changed = False
     for param in signature.parameters.values():
-        param_list.append(
-            Parameter(
-                param.name,
-                kind=kind,
-                default=default_dict.get(param.name, Parameter.empty),
+        default = default_dict.get(param.name, Parameter.empty)
+        if (
+            param.kind != kind
+            or param.default is not default
+            or param.annotation is not Parameter.empty
+        ):
+            changed = True
+            param = Parameter(param.name, kind=kind, default=default)
+        param_list.append(param)
+    param_list.sort(key=param_sorter)
+
+    # the signature already has the kind, defaults, and order
+    if not changed and param_list == list(signature.parameters.values()):
+        return signature
+
+    # the parameters have unique names and are sorted with the defaults
+    # at the end, the validation of the parameter order is skipped
+    return Signature(param_list, __validate_parameters__=False)
+
+
+def binding_info(sig):
+    """Collect the parameter information to bind arguments to the signature.
+
+    Only signatures with positional-or-keyword and keyword-only parameters
+    are supported; otherwise, None is returned.
+
+    :param inspect.Signature sig: signature to bind
+    :returns: positional parameter names, all parameter names in the
+        signature order, and default values
+    :rtype: (tuple, tuple, dict) or None
+    """
+
+    pos_names = []
+    defaults = {}
+    for param in sig.parameters.values():
+        if param.kind not in NODE_PARAMETER_KINDS:
+            return None
+        if param.kind == _POS_OR_KW:
+            pos_names.append(param.name)
+        if param.default is not Parameter.empty:
+            defaults[param.name] = param.default
+
+    return tuple(pos_names), tuple(sig.parameters), defaults
+
+
+def bind_arguments(sig, info, args, kwargs):
+    """Bind the arguments to the signature and apply the defaults.
+
+    The arguments are bound with the parameter names directly, without
+    creating ``inspect.BoundArguments``. The result is in the signature
+    order, the same as ``BoundArguments.apply_defaults``. If the arguments
+    do not match the signature, ``Signature.bind`` is used to raise the
+    same exception as the standard binding.
+
+    :param inspect.Signature sig: signature to bind
+    :param tuple info: binding information of the signature from
+        ``binding_info``
+    :param tuple args: positional arguments
+    :param dict kwargs: keyword arguments
+    :returns: argument values by parameter name
+    :rtype: dict
+    """
+
+    if info is not None:
+        pos_names, names, defaults = info
+        if len(args) <= len(pos_names):
+            arguments = dict(zip(pos_names, args))
+            if arguments.keys().isdisjoint(kwargs):
+                arguments |= kwargs
+                # fill the arguments in the signature order
+                bound = {}
+                passed = 0
+                for name in names:
+                    if name in arguments:
+                        bound[name] = arguments[name]
+                        passed += 1
+                    elif name in defaults:
+                        bound[name] = defaults[name]
+                    else:  # missing argument
+                        break
+                else:
+                    # all arguments match a parameter
+                    if passed == len(arguments):
+                        return bound
+
+    bound = sig.bind(*args, **kwargs)
+    bound.apply_defaults()
+    return bound.arguments
+
+
+# signatures of the module-level builtin functions, None if the
+# function does not have a signature
+_builtin_signatures = {}
+# signatures of the plain functions, stored with the attributes
+# the signatures are derived from
+_function_signatures = WeakKeyDictionary()
+
+
+def is_module_builtin(func):
+    """Check if the function is a builtin function defined at the module level.
+
+    For example, ``math.sqrt`` and ``operator.add``. The builtin methods
+    bound to an instance, for example ``[].append``, are excluded.
+    """
+
+    return isinstance(func, BuiltinFunctionType) and isinstance(
+        getattr(func, "__self__", None), (ModuleType, type(None))
+    )
+
+
+def is_plain_function(func):
+    """Check if the signature of the function is defined by its code object.
+
+    The function is a plain Python function that is not wrapped and
+    does not have a custom signature.
+    """
+
+    return (
+        type(func) is FunctionType
+        and not hasattr(func, "__wrapped__")
+        and not hasattr(func, "__signature__")
+    )
+
+
+def _same_mapping(cached, current):
+    """Check if the mapping has the same keys and the same value objects.
+
+    The values are compared by identity, the default values, such as
+    arrays, may not support the equality comparison.
+    """
+
+    return cached.keys() == current.keys() and all(
+        value is current[key] for key, value in cached.items()
+    )
+
+
+def _same_function_state(state, func):
+    """Check if the function attributes that define the signature are unchanged.
+
+    :param tuple state: code object, defaults, and the copies of the
+        keyword defaults and annotations stored with the signature
+    """
+
+    code, defaults, kwdefaults, annotations = state
+    return (
+        func.__code__ is code
+        and func.__defaults__ is defaults
+        and _same_mapping(kwdefaults, func.__kwdefaults__ or {})
+        and _same_mapping(annotations, func.__annotations__)
+    )
+
+
+def func_signature(func):
+    """Obtain the signature of the function.
+
+    The module-level builtin functions do not change; their signatures
+    (or the lack of) are stored after the first inspection. The signatures
+    of plain functions are stored with the code object, defaults, and
+    copies of the keyword defaults and annotations. The functions are
+    inspected again if any of them is replaced or modified in place.
+    Other callables are inspected with ``inspect.signature``.
+
+    :raises ValueError: if the builtin function does not have a signature
+    """
+
+    if is_plain_function(func):
+        cached = _function_signatures.get(func)
+        if cached is None or not _same_function_state(cached[0], func):
+            state = (
+                func.__code__,
+                func.__defaults__,
+                dict(func.__kwdefaults__ or {}),
+                dict(func.__annotations__),
             )
-        )
+            cached = _function_signatures[func] = (state, signature(func))
+        return cached[1]
 
-    return Signature(sorted(param_list, key=param_sorter))
+    if not is_module_builtin(func):
+        return signature(func)
+
+    if func not in _builtin_signatures:
+        try:
+            _builtin_signatures[func] = signature(func)
+        except ValueError:
+            _builtin_signatures[func] = None
+
+    sig = _builtin_signatures[func]
+    if sig is None:
+        raise ValueError(f"no signature found for builtin {func!r}")
+    return sig
 
 
 def has_signature(func):
@@ -211,12 +479,17 @@ def has_signature(func):
     The function checks if the function has a signature. If the
     function has a signature, the function returns True. If the
     function does not have a signature, the function returns False.
+    Python functions always have a signature, therefore the ``__code__``
+    attribute is checked first to skip the inspection.
     """
 
+    if hasattr(func, "__code__"):
+        return True
+
     try:
-        signature(func)
+        func_signature(func)
         return True
-    except ValueError:
+    except (ValueError, TypeError):
         return False
 
 
@@ -225,13 +498,21 @@ def check_signature(func):
 
     If the function has position-only, or var-positional,
     or var-keyword, or default values, the function returns False.
+    For plain Python functions, the code object is checked directly
+    without creating the signature.
     """
 
-    sig = signature(func)
-    for param in sig.parameters.values():
-        if (
-            param.kind not in [Parameter.KEYWORD_ONLY, Parameter.POSITIONAL_OR_KEYWORD]
-            or param.default is not Parameter.empty
-        ):
-            return False
-    return True
+    if is_plain_function(func):
+        code = func.__code__
+        return not (
+            code.co_posonlyargcount
+            or code.co_flags & (CO_VARARGS | CO_VARKEYWORDS)
+            or func.__defaults__
+            or func.__kwdefaults__
+        )
+
+    sig = func_signature(func)
+    return all(
+        param.kind in NODE_PARAMETER_KINDS and param.default is Parameter.empty
+        for param in sig.parameters.values()
+    )
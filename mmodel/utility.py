@@ -1,6 +1,10 @@
-from inspect import Signature, Parameter
+from inspect import Signature, Parameter, signature
+from collections import deque, Counter
+from itertools import chain
 import networkx as nx
 
+_EMPTY = Parameter.empty
+
 
 # graph properties
 def modelgraph_signature(graph):
@@ -51,29 +55,41 @@ def param_sorter(parameter):
     :rtype: (bool, parameter.name, parameter.kind)
     """
 
-    if parameter.default is not parameter.empty:
-        return parameter.kind, True, parameter.name
-    else:
-        return parameter.kind, False, parameter.name
+    return parameter.kind, parameter.default is not _EMPTY, parameter.name
 
 
 def graph_topological_sort(graph):
     """Determine the topological order.
 
-    `nx.topological_generations` outputs a generator with each node list generation.
-    However, it does not carry the node attributes. The method
-    outputs a list of nodes for each generation.
+    The order is determined by Kahn's algorithm, with a first-in-first-out
+    queue of nodes that have no unprocessed parents. The order is the same
+    as ``nx.topological_sort``, which outputs the nodes generation by
+    generation. However, ``nx.topological_sort`` does not carry the node
+    attributes.
 
     :return: topological order of the graph. Returns a list of nodes and their
         attributes.
     :rtype: list
-
+    :raises networkx.NetworkXUnfeasible: if the graph contains a cycle
     """
 
+    # the degree and attribute dictionaries are read directly
+    # instead of through the graph views
+    in_degree = {node: len(parents) for node, parents in graph._pred.items()}
+    queue = deque(node for node, degree in in_degree.items() if degree == 0)
+    node_attrs = graph._node
+
     topological_order = []
+    while queue:
+        node = queue.popleft()
+        topological_order.append((node, node_attrs[node]))
+        for child in graph._succ[node]:
+            in_degree[child] -= 1
+            if in_degree[child] == 0:
+                queue.append(child)
 
-    for node in nx.topological_sort(graph):
-        topological_order.append((node, graph.nodes[node]))
+    if len(topological_order) != len(in_degree):
+        raise nx.NetworkXUnfeasible("graph contains a cycle")
 
     return topological_order
 
@@ -84,7 +100,7 @@ def replace_subgraph(graph, subgraph, subgraph_node):
     Find all parent nodes, not in the subgraph, but child nodes in the
     subgraph. (All child nodes of subgraph nodes are in the subgraph).
     The edge attribute is passed down to the new edge. Here, a new graph is
-    created by deep copying the original graph.
+    created by deep copying the original graph without the subgraph nodes.
 
     :param graph model_graph: model_graph to modify.
     :param graph subgraph: subgraph that is being replaced by a node
@@ -93,20 +109,26 @@ def replace_subgraph(graph, subgraph, subgraph_node):
     :param str output: output parameter name.
     """
 
-    graph = graph.deepcopy()
-
-    new_edges = []
-    for node in subgraph.nodes():
-        for parent in graph.predecessors(node):
-            if parent not in subgraph:
-                new_edges.append((parent, subgraph_node.name))
-        for child in graph.successors(node):
-            if child not in subgraph:
-                new_edges.append((subgraph_node.name, child))
-
-    graph.remove_nodes_from(subgraph.nodes)
-    # remove unique edges
-    graph.add_edges_from(set(new_edges))
+    subgraph_nodes = frozenset(subgraph.nodes)
+    # the sets remove the duplicated edges
+    parents = set()
+    children = set()
+    for node in subgraph_nodes:
+        parents.update(graph._pred[node])
+        children.update(graph._succ[node])
+    parents -= subgraph_nodes
+    children -= subgraph_nodes
+
+    # only copy the nodes outside the subgraph, the subgraph nodes
+    # are replaced and do not need to be copied
+    graph = nx.restricted_view(graph, subgraph_nodes, []).deepcopy()
+    name = subgraph_node.name
+    graph.add_edges_from(
+        chain(
+            ((parent, name) for parent in parents),
+            ((name, child) for child in children),
+        )
+    )
     graph.set_node_object(subgraph_node)
 
     return graph
@@ -159,11 +181,16 @@ def param_counter(graph, returns):
     # add the additional parameter to list
     value_list += returns
 
-    count = {}
-    for value in value_list:
-        count[value] = count.get(value, 0) + 1
+    return dict(Counter(value_list))
+
 
-    return count
+def graph_name_str(graph):
+    """Graph description used in the exception messages."""
+
+    if graph.name:
+        return f"graph ({graph.name})"
+    else:
+        return "graph"
 
 
 def is_node_attr_defined(graph, attr: str):
@@ -174,23 +201,20 @@ def is_node_attr_defined(graph, attr: str):
     Raise an exception if the attribute is undefined.
     """
 
-    if graph.name:
-        graph_str = f"graph ({graph.name})"
-    else:
-        graph_str = "graph"
+    # the missing nodes are only collected for the exception message
+    if all(attr in node_attr for node_attr in graph._node.values()):
+        return True
 
     node_list = []
     for node, node_attr in graph.nodes.data():
         if attr not in node_attr:
             node_list.append(node)
 
-    if node_list:
-        raise Exception(
-            f"invalid {graph_str}: attribute "
-            f"{repr(attr)} is not defined for node(s) {node_list}."
-        )
-
-    return True
+    graph_str = graph_name_str(graph)
+    raise Exception(
+        f"invalid {graph_str}: attribute "
+        f"{repr(attr)} is not defined for node(s) {node_list}."
+    )
 
 
 def is_edge_attr_defined(graph, attr: str):
@@ -199,22 +223,22 @@ def is_edge_attr_defined(graph, attr: str):
     Raise an exception if the attribute is undefined.
     """
 
-    if graph.name:
-        graph_str = f"graph ({graph.name})"
-    else:
-        graph_str = "graph"
+    # the missing edges are only collected for the exception message
+    if all(
+        attr in edge_attr for nbrs in graph._adj.values() for edge_attr in nbrs.values()
+    ):
+        return True
 
     edge_list = []
     for u, v, edge_attr in graph.edges.data():
         if attr not in edge_attr:
             edge_list.append((u, v))
-    if edge_list:
-        raise Exception(
-            f"invalid {graph_str}: attribute {repr(attr)}"
-            f" is not defined for edge(s) {edge_list}."
-        )
 
-    return True
+    graph_str = graph_name_str(graph)
+    raise Exception(
+        f"invalid {graph_str}: attribute {repr(attr)}"
+        f" is not defined for edge(s) {edge_list}."
+    )
 
 
 def construction_dict(obj, property_list=None, exclude_list=None):
@@ -235,14 +259,24 @@ def construction_dict(obj, property_list=None, exclude_list=None):
         for key, value in obj.__dict__.items()
         if not key.startswith("_") and key not in exclude_list
     }
-    return {**ppt_dict, **attr_dict}
+    return ppt_dict | attr_dict
 
 
 def modify_func(func, modifiers):
-    """Apply modifiers to function."""
+    """Apply modifiers to function.
+
+    The signature of each modified function is stored as ``__signature__``,
+    so the signature inspection does not unwrap the whole modifier chain.
+    """
 
     for mod in modifiers:
-        func = mod(func)
+        mod_func = mod(func)
+        if mod_func is not func and not hasattr(mod_func, "__signature__"):
+            try:
+                mod_func.__signature__ = signature(mod_func)
+            except (AttributeError, TypeError, ValueError):
+                pass  # the signature cannot be inspected or stored
+        func = mod_func
     return func
 
 
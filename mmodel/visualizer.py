@@ -2,6 +2,7 @@ import graphviz
 from copy import deepcopy
 from mmodel.metadata import nodeformatter
 import re
+from pathlib import Path
 
 default_graph_settings = {
     "graph_attr": {
@@ -14,13 +15,23 @@ default_graph_settings = {
 }
 
 
+# unescaped newlines and escaped "\n" are replaced in a single pass
+_LABEL_PATTERN = re.compile(r"(?<!\\)\n|\\n")
+_LABEL_ESCAPES = {"\n": r"\l", "\\n": r"\\n"}
+
+
+def _escape_label_match(match):
+    """Replace the matched newline or escaped newline."""
+    return _LABEL_ESCAPES[match.group()]
+
+
 def format_label(label):
     r"""Format label for graphviz.
 
     The function replaces newlines with the graphviz left-aligned line break.
     However, if the "\n" is escaped, change it to "\\\\n".
     """
-    return re.sub(r"(?<!\\)\n", r"\\l", label).replace("\\n", "\\\\n") + r"\l"
+    return _LABEL_PATTERN.sub(_escape_label_match, label) + r"\l"
 
 
 class Visualizer:
@@ -46,18 +57,26 @@ class Visualizer:
 
         dot_graph = graphviz.Digraph(name=G.name, **settings)
 
-        for node, ndict in G.nodes(data=True):
+        # iterate the node and adjacency dictionaries directly, in the
+        # same order as the node and edge data views
+        for node, ndict in G._node.items():
             node_str = self.format_node(node, ndict)
             nlabel = format_label(node_str)
             dot_graph.node(node, label=nlabel)
 
-        for u, v, edict in G.edges(data=True):
-            edge_str = self.format_edge(u, v, edict)
-            xlabel = format_label(edge_str)
-            dot_graph.edge(u, v, xlabel=xlabel)
+        for u, nbrs in G._succ.items():
+            for v, edict in nbrs.items():
+                edge_str = self.format_edge(u, v, edict)
+                xlabel = format_label(edge_str)
+                dot_graph.edge(u, v, xlabel=xlabel)
 
         if outfile:
-            dot_graph.render(outfile=outfile)
+            # the DOT source is written directly, other formats are
+            # rendered with the graphviz executable
+            if Path(outfile).suffix in (".dot", ".gv"):
+                dot_graph.save(filename=str(outfile))
+            else:
+                dot_graph.render(outfile=outfile)
 
         return dot_graph
 
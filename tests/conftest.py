@@ -4,7 +4,9 @@ The configuration file provides several default graph fixtures
 and test functions.
 
 1. `standard_G` - test graph generated using DiGraph, scope: function
-2. `mmodel_G` - test graph generated using Graph, scope: function
+2. `mmodel_G` - test graph generated using Graph, scope: session
+    The graph is shared by all tests; tests should not modify it in place.
+3. `mmodel_nodes` - node names of `mmodel_G`, scope: session
 """
 
 
@@ -99,7 +101,7 @@ def standard_G():
     return G
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def mmodel_G():
     """Mock test graph generated using Graph.
 
@@ -121,7 +123,14 @@ def mmodel_G():
     return G
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
+def mmodel_nodes(mmodel_G):
+    """The node names of the mmodel_G graph."""
+
+    return frozenset(mmodel_G.nodes)
+
+
+@pytest.fixture(scope="session")
 def mmodel_signature():
     """The default signature of the mmodel_G models."""
 
@@ -159,15 +168,18 @@ def graph_equal(G1, G2):
     Dictionary comparison does not care about key orders.
     """
 
-    for node in G1.nodes:
-        assert node in G2.nodes
-        for attr in G1.nodes[node]:
+    # compare the structure first, the node sets and the edge dictionaries
+    # are cheap to compare and fail fast before the attribute walk
+    assert G1.nodes.keys() <= G2.nodes.keys()
+    assert dict(G1.edges) == dict(G2.edges)
+
+    for node, attrs in G1.nodes.items():
+        attrs2 = G2.nodes[node]
+        for attr, value in attrs.items():
             if attr == "node_object":
-                assert G1.nodes[node][attr].__dict__ == G2.nodes[node][attr].__dict__
+                assert value.__dict__ == attrs2[attr].__dict__
             else:
-                assert G1.nodes[node][attr] == G2.nodes[node][attr]
-
-    assert dict(G1.edges) == dict(G2.edges)
+                assert value == attrs2[attr]
 
     # test graph attributes
     assert G1.graph == G2.graph
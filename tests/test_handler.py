@@ -157,6 +157,13 @@ class HandlerTester:
 
         # assert handler_instance.__name__ == "handler"
         assert list(handler_instance.__signature__.parameters) == ["a", "b", "d", "f"]
+        assert handler_instance.node_parameters == {
+            "add": ("a",),
+            "subtract": ("c", "d"),
+            "power": ("c", "f"),
+            "log": ("c", "b"),
+            "multiply": ("e", "g"),
+        }
 
     def test_execution(self, handler_instance):
         """Test running the model as a function."""
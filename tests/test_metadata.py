@@ -84,6 +84,41 @@ class TestMetaDataFormatter:
             SNs(a="This is a test string. With long lines, \ttab, and\nwhitespaces.")
         ) == dedent(wrapped_str)
 
+    def test_wrapping_short_lines(self, wrap):
+        """Test short lines match the text wrapper output.
+
+        The text wrapper still applies the indentation and strips the
+        surrounding whitespace of the short lines.
+        """
+
+        formatter = meta.MetaDataFormatter({}, ["a", "b"], wrap)
+        assert formatter(SNs(a="short", b=" 1 ")) == "a: short\nb:  1"
+
+        indent_wrap = TextWrapper(width=20, initial_indent="  ")
+        formatter = meta.MetaDataFormatter({}, ["a", "b"], indent_wrap)
+        assert formatter(SNs(a="short", b=1)) == "a: short\n  b: 1"
+
+    def test_wrapping_short_lines_custom_wrapper(self):
+        """Test short lines use the options and overrides of the text wrapper."""
+
+        sentence_wrap = TextWrapper(width=20, fix_sentence_endings=True)
+        formatter = meta.MetaDataFormatter({}, ["a"], sentence_wrap)
+        assert formatter(SNs(a="End. Next")) == "a: End.  Next"
+
+        class UpperWrapper(TextWrapper):
+            def wrap(self, text):
+                return [line.upper() for line in super().wrap(text)]
+
+        formatter = meta.MetaDataFormatter({}, ["a"], UpperWrapper(width=20))
+        assert formatter(SNs(a="short")) == "A: SHORT"
+
+        class WrapOnly:
+            def wrap(self, text):
+                return [text.upper()]
+
+        formatter = meta.MetaDataFormatter({}, ["a"], WrapOnly())
+        assert formatter(SNs(a="short")) == "A: SHORT"
+
     def test_shorten(self, wrap):
         """Test shorten options."""
 
@@ -116,14 +116,16 @@ class TestModel:
 
     def test_get_node(self, model_instance, mmodel_G):
         """Test get_node method of the model."""
-        node_attr = model_instance.get_node("log")
+        # copy the attributes, mmodel_G is shared between tests
+        node_attr = dict(model_instance.get_node("log"))
+        G_node_attr = dict(mmodel_G.nodes["log"])
 
         assert (
             node_attr.pop("node_object").__dict__
-            == mmodel_G.nodes["log"].pop("node_object").__dict__
+            == G_node_attr.pop("node_object").__dict__
         )
 
-        assert node_attr == mmodel_G.nodes["log"]
+        assert node_attr == G_node_attr
 
     def test_get_node_obj(self, model_instance, mmodel_G):
         """Test get_node_object method of the model."""
@@ -97,6 +97,25 @@ class TestSetNodeObject:
         node.inputs.append("f")
         assert node.inputs == ["a", "b"]
 
+    def test_node_signature_update(self, node):
+        """Test the node signature follows the node function.
+
+        The signature changes if the node_func is overwritten or if its
+        defaults are changed in place.
+        """
+
+        node.node_func = lambda x: x
+        assert list(node.signature.parameters) == ["x"]
+
+        def func(a, b):
+            return a + b
+
+        node = Node("func", func)
+        assert node.signature.parameters["b"].default is Parameter.empty
+
+        func.__defaults__ = (5,)
+        assert node.signature.parameters["b"].default == 5
+
 
 class TestNodeConstruction:
     """Test node construction."""
@@ -204,6 +223,12 @@ class TestSignatureModification:
         with pytest.raises(Exception, match="'inputs' required for node 'Test'"):
             Node("Test", np.add)
 
+    def test_non_callable_exception(self):
+        """Test exception when the node function is not callable."""
+
+        with pytest.raises(TypeError, match="int object is not callable"):
+            Node("Test", 1, ["a"])
+
     def test_model_as_function(self, mmodel_G):
         """Test ``model_func`` is used when the function input is a Model instance."""
 
@@ -1,16 +1,25 @@
 from mmodel.signature import (
     split_arguments,
+    classify_parameters,
+    signature_source,
+    compile_source,
+    compile_wrapper,
     convert_signature,
     add_signature,
     modify_signature,
     restructure_signature,
     has_signature,
+    is_module_builtin,
+    is_plain_function,
+    func_signature,
     check_signature,
+    binding_info,
+    bind_arguments,
 )
 from inspect import signature, Parameter
+from types import FunctionType
 import pytest
 import operator
-import numpy as np
 import math
 
 
@@ -35,6 +44,65 @@ def test_split_arguments():
     assert kwargs == {"c": 3, "d": 4, "e": 5, "f": 6}
 
 
+def test_classify_parameters():
+    """Test the classify_parameters function."""
+
+    sig_dict, sig_count, nd_sig_count = classify_parameters(signature(tfunc))
+
+    assert sig_dict == {
+        0: ["a", "b"],
+        1: ["c", "d"],
+        2: [],
+        3: ["e", "f"],
+        4: ["kwargs"],
+    }
+    assert sig_count == [2, 2, 0, 2, 1]
+    assert nd_sig_count == [2, 2, 0, 1, 1]
+
+
+def test_signature_source():
+    """Test the signature_source function."""
+
+    sig = signature(lambda a, b, *, c, d: None)
+    assert signature_source(sig) == "a, b, *, c, d"
+
+    sig = signature(lambda *, c: None)
+    assert signature_source(sig) == "*, c"
+
+
+def test_compile_wrapper():
+    """Test the compile_wrapper function.
+
+    The parameter named "func" should not shadow the wrapped function.
+    """
+
+    def func(a, b, /, c):
+        """Docstring of func."""
+        return a - b + c
+
+    sig = signature(lambda func, b, c: None)
+    wrapped = compile_wrapper(func, sig, ["func", "b", "c=c"])
+
+    assert signature(wrapped) == sig
+    assert wrapped.__name__ == "func"
+    assert wrapped.__doc__ == "Docstring of func."
+    assert wrapped(func=3, b=2, c=1) == 2
+    assert wrapped(3, 2, 1) == 2
+
+
+def test_compile_wrapper_shared_code():
+    """Test wrappers with the same source share the compiled code."""
+
+    sig = signature(lambda a, b: None)
+    add_wrapper = compile_wrapper(operator.add, sig, ["a", "b"])
+    sub_wrapper = compile_wrapper(operator.sub, sig, ["a", "b"])
+
+    assert add_wrapper.__code__ is sub_wrapper.__code__
+    assert add_wrapper(a=3, b=1) == 4
+    assert sub_wrapper(a=3, b=1) == 2
+    assert compile_source.cache_info().hits > 0
+
+
 def test_modify_signature():
     """Test the modify_signature function."""
 
@@ -102,6 +170,17 @@ def test_modify_signature_inputs_number():
         modify_signature(tfunc, ["a", "b", "c", "d"])
 
 
+def test_modify_signature_same_inputs():
+    """Test the function is returned unchanged if the inputs match the signature."""
+
+    def func(a, b):
+        return a + b
+
+    assert modify_signature(func, ["a", "b"]) is func
+    assert modify_signature(func, ["b", "a"]) is not func
+    assert modify_signature(tfunc, ["a", "b", "c", "d", "e"]) is not tfunc
+
+
 def test_modify_signature_pos_expand():
     """Test if the given inputs are not enough, the function raises exception."""
 
@@ -155,6 +234,27 @@ def test_convert_signature():
     assert 'f' not in signature(new_func).parameters.keys()
 
 
+def test_convert_signature_unchanged():
+    """Test the function is returned if the signature needs no conversion."""
+
+    def func(a, *, b):
+        return a + b
+
+    assert convert_signature(func) is func
+
+
+def test_convert_signature_defaults_changed():
+    """Test the wrapper follows the changes of the function defaults."""
+
+    def func(a, b=1):
+        return a + b
+
+    assert list(signature(convert_signature(func)).parameters) == ["a"]
+
+    func.__defaults__ = None
+    assert convert_signature(func) is func
+
+
 def test_convert_signature_with_pre_defined():
     """Test the convert_signature function with pre-defined functions."""
 
@@ -169,6 +269,8 @@ def test_convert_signature_with_pre_defined():
 def test_add_signature():
     """Test the add_signature function."""
 
+    import numpy as np
+
     new_add = add_signature(np.add, ["first", "second"])
 
     for param in signature(new_add).parameters.values():
@@ -209,10 +311,16 @@ def test_restructure_signature():
     bound.apply_defaults()
     assert bound.arguments["c"] == 5
 
+    # the signature is unchanged
+    assert restructure_signature(new_sig, default_dict) is new_sig
+    assert restructure_signature(new_sig, {}) is not new_sig
+
 
 def test_has_signature():
     """Test the has_signature function."""
 
+    import numpy as np
+
     assert has_signature(tfunc)
     assert not has_signature(np.add)
     assert has_signature(np.sum)
@@ -221,9 +329,103 @@ def test_has_signature():
     assert not has_signature(math.log)
 
 
+def test_is_module_builtin():
+    """Test the is_module_builtin function."""
+
+    assert is_module_builtin(math.sqrt)
+    assert is_module_builtin(operator.add)
+    assert is_module_builtin(sum)
+    assert not is_module_builtin([].append)
+    assert not is_module_builtin(tfunc)
+
+
+def test_func_signature():
+    """Test the func_signature function for builtin functions."""
+
+    assert func_signature(tfunc) == signature(tfunc)
+    assert func_signature(tfunc) is func_signature(tfunc)
+    assert func_signature(math.sqrt) == signature(math.sqrt)
+    # stored signature is returned
+    assert func_signature(math.sqrt) is func_signature(math.sqrt)
+
+    for _ in range(2):  # the missing signature is also stored
+        with pytest.raises(ValueError, match="no signature found for builtin"):
+            func_signature(math.log)
+
+
+def test_func_signature_replaced_defaults():
+    """Test the plain function signature is inspected again with new defaults."""
+
+    def func(a, b=1):
+        return a + b
+
+    sig = func_signature(func)
+    assert func_signature(func) is sig
+
+    func.__defaults__ = (2,)
+    assert func_signature(func).parameters["b"].default == 2
+
+
+def test_func_signature_modified_kwdefaults():
+    """Test the plain function signature follows in-place changes.
+
+    The keyword defaults and annotations are modified without replacing
+    the dictionaries.
+    """
+
+    def func(a, *, c=1):
+        return a + c
+
+    assert func_signature(func).parameters["c"].default == 1
+
+    func.__kwdefaults__["c"] = 5
+    assert func_signature(func) == signature(func)
+    assert func_signature(func).parameters["c"].default == 5
+
+    func.__annotations__["a"] = int
+    assert func_signature(func).parameters["a"].annotation is int
+
+
+def test_is_plain_function():
+    """Test the is_plain_function function."""
+
+    assert is_plain_function(tfunc)
+    assert is_plain_function(lambda a: a)
+    assert not is_plain_function(math.sqrt)
+    assert not is_plain_function(modify_signature(tfunc, ["a", "b", "c", "d", "e"]))
+
+
+@pytest.mark.parametrize(
+    "func, result",
+    [
+        (lambda: None, True),
+        (lambda a, b: None, True),
+        (lambda a, *, b: None, True),
+        (lambda a, b=1: None, False),
+        (lambda a, *, b=1: None, False),
+        (lambda a, /, b: None, False),
+        (lambda *args: None, False),
+        (lambda **kwargs: None, False),
+    ],
+)
+def test_check_signature_plain_function(func, result):
+    """Test check_signature on plain functions matches the signature inspection."""
+
+    assert check_signature(func) == result
+
+    # force the signature inspection on a copy of the shared function
+    func_copy = FunctionType(func.__code__, {})
+    func_copy.__defaults__ = func.__defaults__
+    func_copy.__kwdefaults__ = func.__kwdefaults__
+    func_copy.__signature__ = signature(func)
+    assert check_signature(func_copy) == result
+
+
 def test_check_signature():
     """Test the check_signature function."""
 
+    import numpy as np
+
     def func(a, *, b):
         return
 
@@ -232,3 +434,68 @@ def test_check_signature():
     assert not check_signature(np.sum)
     assert not check_signature(operator.add)
     assert not check_signature(math.sqrt)
+
+
+def test_binding_info():
+    """Test the binding_info function."""
+
+    def func(a, b=2, *, c, d=4):
+        return
+
+    assert binding_info(signature(func)) == (
+        ("a", "b"),
+        ("a", "b", "c", "d"),
+        {"b": 2, "d": 4},
+    )
+    assert binding_info(signature(tfunc)) is None
+
+
+def test_bind_arguments():
+    """Test the bind_arguments function against Signature.bind."""
+
+    def func(a, b=2, *, c, d=4):
+        return
+
+    sig = signature(func)
+    info = binding_info(sig)
+
+    assert bind_arguments(sig, info, (1,), {"c": 3}) == {
+        "a": 1,
+        "b": 2,
+        "c": 3,
+        "d": 4,
+    }
+    # the arguments are in the signature order
+    assert list(bind_arguments(sig, info, (1,), {"c": 3})) == list(sig.parameters)
+    assert list(bind_arguments(sig, info, (), {"d": 5, "c": 3, "a": 1})) == list(
+        sig.parameters
+    )
+    assert bind_arguments(sig, info, (1, 5), {"c": 3, "d": 6}) == {
+        "a": 1,
+        "b": 5,
+        "c": 3,
+        "d": 6,
+    }
+
+    with pytest.raises(TypeError, match="too many positional arguments"):
+        bind_arguments(sig, info, (1, 2, 3), {})
+
+    with pytest.raises(TypeError, match="missing a required argument: 'c'"):
+        bind_arguments(sig, info, (1,), {})
+
+    with pytest.raises(TypeError, match="multiple values for argument 'a'"):
+        bind_arguments(sig, info, (1,), {"a": 1, "c": 3})
+
+    with pytest.raises(TypeError, match="got an unexpected keyword argument 'e'"):
+        bind_arguments(sig, info, (1,), {"c": 3, "e": 5})
+
+    # signature with positional-only parameters uses the standard binding
+    assert bind_arguments(signature(tfunc), None, (1, 2, 3, 4), {"e": 5}) == {
+        "a": 1,
+        "b": 2,
+        "c": 3,
+        "d": 4,
+        "e": 5,
+        "f": 2,
+        "kwargs": {},
+    }
@@ -1,19 +1,27 @@
 import inspect
 import pytest
 import random
-from collections import OrderedDict
 from inspect import Parameter
 import networkx as nx
 import mmodel.utility as util
 from mmodel.node import Node
 
 
-@pytest.fixture
-def func():
-    def example_func(a, c, b=2, *args, d, e=10, **kwargs):
-        return
+def example_func(a, c, b=2, *args, d, e=10, **kwargs):
+    return
+
 
-    return example_func
+# the parameters are inspected once for all param_sorter tests
+_FUNC_PARAMS = inspect.signature(example_func).parameters
+_SORTED_PARAMS = (
+    Parameter("a", 1),
+    Parameter("c", 1),
+    Parameter("b", 1, default=2),
+    Parameter("args", 2),
+    Parameter("d", 3),
+    Parameter("e", 3, default=10),
+    Parameter("kwargs", 4),
+)
 
 
 @pytest.mark.parametrize(
@@ -28,36 +36,25 @@ def func():
         ("kwargs", (4, False, "kwargs")),
     ],
 )
-def test_param_sorter(parameter, result, func):
+def test_param_sorter(parameter, result):
     """Test param_sorter result."""
 
-    params = inspect.signature(func).parameters
-    assert util.param_sorter(params[parameter]) == result
+    assert util.param_sorter(_FUNC_PARAMS[parameter]) == result
 
 
-def test_param_sorter_order(func):
+def test_param_sorter_order():
     """Test param_sorter sorting order.
 
     The correct order is a, b, *args, c, **kwargs, d=10.s
     """
 
-    params = inspect.signature(func).parameters
-    shuffled_params_list = list(params.items())
+    shuffled_params_list = list(_FUNC_PARAMS.items())
     random.shuffle(shuffled_params_list)
-    shuffled_params = OrderedDict(shuffled_params_list)
+    shuffled_params = dict(shuffled_params_list)
 
-    param_list = [
-        Parameter("a", 1),
-        Parameter("c", 1),
-        Parameter("b", 1, default=2),
-        Parameter("args", 2),
-        Parameter("d", 3),
-        Parameter("e", 3, default=10),
-        Parameter("kwargs", 4),
-    ]
-
-    # inspect.Signature(param_list)
-    assert sorted(shuffled_params.values(), key=util.param_sorter) == param_list
+    # inspect.Signature(_SORTED_PARAMS)
+    sorted_params = sorted(shuffled_params.values(), key=util.param_sorter)
+    assert tuple(sorted_params) == _SORTED_PARAMS
 
 
 def test_modelgraph_signature(mmodel_G, mmodel_signature):
@@ -123,6 +120,28 @@ def test_graph_topological_sort(mmodel_G):
     assert list(list(zip(*order))[0]) == ["add", "subtract", "power", "log", "multiply"]
 
 
+def test_graph_topological_sort_networkx(standard_G):
+    """Test graph_topological_sort has the same order as networkx."""
+
+    G = nx.DiGraph()
+    G.add_edges_from([("a", "c"), ("b", "c"), ("b", "d"), ("d", "e"), ("c", "e")])
+    G.add_node("f")
+
+    for graph in [G, standard_G]:
+        order = util.graph_topological_sort(graph)
+        assert [node for node, _ in order] == list(nx.topological_sort(graph))
+        assert all(attr is graph.nodes[node] for node, attr in order)
+
+
+def test_graph_topological_sort_cycle():
+    """Test graph_topological_sort raises an exception for cycle graphs."""
+
+    G = nx.DiGraph([("a", "b"), ("b", "c"), ("c", "a")])
+
+    with pytest.raises(nx.NetworkXUnfeasible, match="graph contains a cycle"):
+        util.graph_topological_sort(G)
+
+
 def test_param_counter(mmodel_G):
     """Test param_counter."""
 
@@ -202,6 +221,20 @@ def test_modify_node(mmodel_G, value_modifier):
     assert mod_G.nodes["subtract"]["node_object"](1, 2) == 0
 
 
+def test_modify_func(value_modifier):
+    """Test modify_func stores the signature of the modified functions."""
+
+    def func(a, b):
+        return a + b
+
+    mod_func = util.modify_func(func, [value_modifier(1), value_modifier(2)])
+
+    assert mod_func(1, 2) == 6
+    assert mod_func.__signature__ == inspect.signature(func)
+    assert mod_func.__wrapped__.__signature__ == inspect.signature(func)
+    assert not hasattr(func, "__signature__")
+
+
 def test_is_node_attr_defined():
     """Test is_node_attr_defined."""
 
@@ -251,14 +284,14 @@ def test_is_edge_attr_defined():
         util.is_edge_attr_defined(g, "w")
 
 
-def test_parse_functype(func):
+def test_parse_functype():
     """Test parse_functype."""
 
     import numpy as np
     import math
     import operator
 
-    assert util.parse_functype(func) == "function"
+    assert util.parse_functype(example_func) == "function"
     assert util.parse_functype(math.acos) == "builtin_function_or_method"
     assert util.parse_functype(operator.add) == "builtin_function_or_method"
     assert util.parse_functype(np.sum) == "numpy._ArrayFunctionDispatcher"